@@ -6,16 +6,22 @@ audio/synth logic in vbz_session and vbz_synth.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import os, time, csv, sys
-from typing import Optional
+import os, re, time, sys, queue, threading
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from vbz_drill import DrillSpec
 from vbz_session import SessionRunner
-from vbz_utils import MORSE_MAP, norm_text, levenshtein
+from vbz_utils import MORSE_KEYS, norm_text, levenshtein
 
+# Metrics rows are appended in one buffered write on Stop
+METRICS_BUFFER_SIZE = 64 * 1024
+# How often the Tk loop checks for a finished scoring worker (ms)
+METRICS_POLL_MS = 50
 
-def get_default_log_dir() -> str:
-    """Get platform-appropriate default log directory.
+
+def _compute_default_log_dir() -> str:
+    """Compute the platform-appropriate default log directory.
 
     Returns:
         Path to the default log directory based on the platform.
@@ -33,6 +39,93 @@ def get_default_log_dir() -> str:
         return os.path.join(xdg_data, 'vbzbreaker', 'logs')
 
 
+# Resolved once at import; the platform and home directory do not change.
+_DEFAULT_LOG_DIR = _compute_default_log_dir()
+
+
+def get_default_log_dir() -> str:
+    """Get platform-appropriate default log directory.
+
+    Returns:
+        Path to the default log directory based on the platform.
+    """
+    return _DEFAULT_LOG_DIR
+
+
+# Text a numeric Spinbox may hold while being typed: digits with at most one point
+_NUMERIC_INPUT_RE = re.compile(r'^\d*\.?\d*$')
+
+# A well-formed pair entry: two Morse characters (A-Z, 0-9) around a comma.
+# ASCII mode keeps case folding from letting in look-alikes such as the Kelvin sign.
+_PAIR_RE = re.compile(r'^\s*([A-Z0-9])\s*,\s*([A-Z0-9])\s*$', re.IGNORECASE | re.ASCII)
+# The character class stands in for a MORSE_KEYS lookup, so it must not admit more
+assert set("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789") <= MORSE_KEYS
+
+
+@lru_cache(maxsize=128)
+def _parse_pair(pair_str: str) -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
+    """Parse an ``A,B`` pair entry.
+
+    Results are memoized by the raw text, so retyping or restoring an
+    earlier entry does not parse it again.
+
+    Args:
+        pair_str: Raw text of the pair entry (e.g. "h, 5").
+
+    Returns:
+        ``((a, b), None)`` with upper-cased characters on success, otherwise
+        ``(None, message)`` describing the problem.
+    """
+    m = _PAIR_RE.match(pair_str)
+    if m:
+        return (m.group(1).upper(), m.group(2).upper()), None
+
+    # Malformed: walk the checks step by step to report the specific problem
+    head, sep, tail = pair_str.partition(",")
+    if not sep:
+        return None, "Enter active pair as A,B (e.g., H,5)"
+    if "," in tail:
+        return None, "Enter exactly two characters separated by comma (e.g., H,5)"
+
+    a, b = head.replace(" ", "").strip().upper(), tail.replace(" ", "").strip().upper()
+    if not a or not b:
+        return None, "Both characters must be non-empty"
+
+    if a not in MORSE_KEYS:
+        return None, f"Character '{a}' is not valid. Use A-Z or 0-9."
+    if b not in MORSE_KEYS:
+        return None, f"Character '{b}' is not valid. Use A-Z or 0-9."
+    return (a, b), None
+
+
+# Status-pane instructions per drill mode
+_INSTRUCTIONS = {
+    "reanchor":
+        "Re-anchor:\n• Alternate slow↔fast A/B blocks.\n• Focus on FEEL; do NOT copy.\n• Separation slider (if enabled) pans A left, B right.\n• Jitter/variation helps de-normalize timing.",
+    "contrast":
+        "Contrast:\n• Copy dense A/B minimal-pair strings at normal speed.\n• Accuracy matters; repeat short lines.\n• Separation slider (if enabled) pans A left, B right.",
+    "context":
+        "Context:\n• You will hear call-like strings containing your pair.\n• Type what you copy into the box below (A–Z, 0–9).\n• On Stop, VBZBreaker computes accuracy vs what was sent.\n• Mono-only (stereo disabled).",
+    "overspeed":
+        "Overspeed:\n• Short high-WPM burst of pair-heavy lines.\n• Type what you copy into the box below (A–Z, 0–9).\n• On Stop, VBZBreaker computes accuracy.\n• Mono-only (stereo disabled)."
+}
+# Hint shown in the copy box while it is not in use
+_COPY_PLACEHOLDER = "Type what you copy here (A–Z, 0–9, spaces ignored in scoring)."
+
+# Spinbox rows built by App._spinbox_row: (label, App attribute, from, to, increment, width)
+_JITTER_SPINBOXES = (
+    ("Jitter (±%):", "jitter", 0.0, 0.3, 0.01, 6),
+    ("WPM jitter (±):", "wpm_jitter", 0.0, 5.0, 0.5, 6),
+    ("Tone jitter (±Hz):", "tone_jitter", 0.0, 300.0, 10.0, 7),
+)
+_SPEED_SPINBOXES = (
+    ("Low WPM:", "low_wpm", 6, 30, 1, 6),
+    ("High WPM:", "high_wpm", 20, 50, 1, 6),
+    ("Block (s):", "block_seconds", 6, 30, 1, 6),
+    ("Overspeed WPM:", "overspeed_wpm", 24, 45, 1, 6),
+)
+
+
 class App(tk.Tk):
     """Main application window and UI wiring.
 
@@ -66,13 +159,24 @@ class App(tk.Tk):
         self.log_dir = tk.StringVar(value=get_default_log_dir())
         self.status = tk.StringVar(value="Welcome to VBZBreaker")
         self.runner: Optional[SessionRunner] = None
+        self._metrics_win: Optional[tk.Toplevel] = None  # built on first use
+
+        # Parse the pair entry once per edit rather than on every Start
+        self._pair_parsed = _parse_pair(self.active_pair.get())
+        self.active_pair.trace_add("write", self._on_pair_changed)
 
         self._build_ui()
 
+    def _numeric_key_ok(self, proposed: str) -> bool:
+        """Spinbox key validator: accept only (partial) non-negative numbers."""
+        return _NUMERIC_INPUT_RE.match(proposed) is not None
+
     def _build_ui(self):
         """Construct the Tkinter layout and controls."""
         frm = ttk.Frame(self)
         frm.pack(fill="both", expand=True, padx=8, pady=8)
+        # Reject non-numeric keystrokes so numeric variables always read back
+        self._numeric_vcmd = (self.register(self._numeric_key_ok), "%P")
 
         # Top controls (session config)
         top = ttk.LabelFrame(frm, text="Session")
@@ -85,10 +189,12 @@ class App(tk.Tk):
         ttk.OptionMenu(top, self.mode, self.mode.get(), "reanchor","contrast","context","overspeed").grid(row=0,column=3,padx=6)
 
         ttk.Label(top, text="WPM:").grid(row=0, column=4, sticky="e")
-        ttk.Spinbox(top, from_=8, to=50, increment=1, textvariable=self.wpm, width=6).grid(row=0, column=5, padx=6)
+        ttk.Spinbox(top, from_=8, to=50, increment=1, textvariable=self.wpm, width=6,
+                    validate="key", validatecommand=self._numeric_vcmd).grid(row=0, column=5, padx=6)
 
         ttk.Label(top, text="Tone (Hz):").grid(row=0, column=6, sticky="e")
-        ttk.Spinbox(top, from_=300, to=1000, increment=10, textvariable=self.tone, width=7).grid(row=0, column=7, padx=6)
+        ttk.Spinbox(top, from_=300, to=1000, increment=10, textvariable=self.tone, width=7,
+                    validate="key", validatecommand=self._numeric_vcmd).grid(row=0, column=7, padx=6)
 
         ttk.Button(top, text="Start", command=self.start_session).grid(row=0, column=8, padx=8)
         ttk.Button(top, text="Stop", command=self.stop_session).grid(row=0, column=9, padx=4)
@@ -100,39 +206,32 @@ class App(tk.Tk):
 
         ttk.Label(opt, text="Separation:").grid(row=0,column=1,sticky="e")
         sep = ttk.Scale(opt, from_=0.0, to=1.0, orient="horizontal", variable=self.sep_pct)
+        sep.bind("<ButtonRelease-1>", self._snap_sep)
         sep.grid(row=0, column=2, padx=4, sticky="ew")
         opt.columnconfigure(2, weight=1)
         ttk.Label(opt, text="0=mono — 1=fully split (snap 0.25)").grid(row=0, column=3, sticky="w", padx=6)
 
-        ttk.Label(opt, text="Jitter (±%):").grid(row=1, column=0, sticky="e")
-        ttk.Spinbox(opt, from_=0.0, to=0.3, increment=0.01, textvariable=self.jitter, width=6).grid(row=1, column=1, padx=4, sticky="w")
-
-        ttk.Label(opt, text="WPM jitter (±):").grid(row=1, column=2, sticky="e")
-        ttk.Spinbox(opt, from_=0.0, to=5.0, increment=0.5, textvariable=self.wpm_jitter, width=6).grid(row=1, column=3, padx=4, sticky="w")
-
-        ttk.Label(opt, text="Tone jitter (±Hz):").grid(row=1, column=4, sticky="e")
-        ttk.Spinbox(opt, from_=0.0, to=300.0, increment=10.0, textvariable=self.tone_jitter, width=7).grid(row=1, column=5, padx=4, sticky="w")
+        self._spinbox_row(opt, 1, _JITTER_SPINBOXES)
 
         # Re-anchor & Overspeed settings
         ra = ttk.LabelFrame(frm, text="Re-anchor / Overspeed Settings")
         ra.pack(fill="x", padx=4, pady=4)
 
-        ttk.Label(ra, text="Low WPM:").grid(row=0,column=0,sticky="e")
-        ttk.Spinbox(ra, from_=6, to=30, increment=1, textvariable=self.low_wpm, width=6).grid(row=0,column=1,padx=4)
-        ttk.Label(ra, text="High WPM:").grid(row=0,column=2,sticky="e")
-        ttk.Spinbox(ra, from_=20, to=50, increment=1, textvariable=self.high_wpm, width=6).grid(row=0,column=3,padx=4)
-        ttk.Label(ra, text="Block (s):").grid(row=0,column=4,sticky="e")
-        ttk.Spinbox(ra, from_=6, to=30, increment=1, textvariable=self.block_seconds, width=6).grid(row=0,column=5,padx=4)
-
-        ttk.Label(ra, text="Overspeed WPM:").grid(row=0,column=6,sticky="e")
-        ttk.Spinbox(ra, from_=24, to=45, increment=1, textvariable=self.overspeed_wpm, width=6).grid(row=0,column=7,padx=4)
+        self._spinbox_row(ra, 0, _SPEED_SPINBOXES)
 
         # Copy input (Context & Overspeed)
         copyf = ttk.LabelFrame(frm, text="Copy Input (Context & Overspeed)")
         copyf.pack(fill="both", expand=False, padx=4, pady=4)
         self.copy_text = tk.Text(copyf, height=6, wrap="word")
         self.copy_text.pack(fill="both", expand=True, padx=6, pady=6)
-        self.copy_text.insert("1.0", "Type what you copy here (A–Z, 0–9, spaces ignored in scoring).")
+        # Grey hint laid over the empty box rather than inserted into it
+        self._copy_hint = tk.Label(self.copy_text, text=_COPY_PLACEHOLDER, fg="grey",
+                                   bg=self.copy_text.cget("background"))
+        self._copy_hint.bind("<Button-1>", lambda _e: self.copy_text.focus_set())
+        self.copy_text.bind("<FocusIn>", lambda _e: self._copy_hint.place_forget())
+        self.copy_text.bind("<FocusOut>", self._restore_copy_hint)
+        self.copy_text.bind("<KeyPress>", self._copy_key_filter)
+        self._copy_hint.place(x=2, y=2)
         self.copy_text.config(state="disabled")
 
         # Status / instructions
@@ -141,36 +240,68 @@ class App(tk.Tk):
         self.status_lbl = ttk.Label(statusf, textvariable=self.status, anchor="w", justify="left")
         self.status_lbl.pack(fill="both", expand=True, padx=6, pady=6)
 
-        def snap_sep(*_):
-            v = self.sep_pct.get()
-            snapped = round(v / 0.25) * 0.25
-            self.sep_pct.set(min(1.0, max(0.0, snapped)))
-        self.sep_pct.trace_add("write", snap_sep)
-
         self._set_instructions(self.mode.get())
         def on_mode_change(*_):
             self._set_instructions(self.mode.get())
         self.mode.trace_add("write", on_mode_change)
 
+    def _spinbox_row(self, parent, row: int, specs):
+        """Grid a label and Spinbox for each spec, left to right along ``row``.
+
+        Args:
+            parent: Container to grid into.
+            row: Grid row.
+            specs: ``(label, attribute, from, to, increment, width)`` tuples;
+                ``attribute`` names the App variable the Spinbox edits.
+        """
+        for i, (label, attr, lo, hi, step, width) in enumerate(specs):
+            ttk.Label(parent, text=label).grid(row=row, column=2*i, sticky="e")
+            ttk.Spinbox(parent, from_=lo, to=hi, increment=step, textvariable=getattr(self, attr),
+                        width=width, validate="key", validatecommand=self._numeric_vcmd
+                        ).grid(row=row, column=2*i + 1, padx=4, sticky="w")
+
     def _set_instructions(self, mode: str):
         """Update instructions text and enable/disable copy input area."""
-        ins = {
-            "reanchor":
-                "Re-anchor:\n• Alternate slow↔fast A/B blocks.\n• Focus on FEEL; do NOT copy.\n• Separation slider (if enabled) pans A left, B right.\n• Jitter/variation helps de-normalize timing.",
-            "contrast":
-                "Contrast:\n• Copy dense A/B minimal-pair strings at normal speed.\n• Accuracy matters; repeat short lines.\n• Separation slider (if enabled) pans A left, B right.",
-            "context":
-                "Context:\n• You will hear call-like strings containing your pair.\n• Type what you copy into the box below (A–Z, 0–9).\n• On Stop, VBZBreaker computes accuracy vs what was sent.\n• Mono-only (stereo disabled).",
-            "overspeed":
-                "Overspeed:\n• Short high-WPM burst of pair-heavy lines.\n• Type what you copy into the box below (A–Z, 0–9).\n• On Stop, VBZBreaker computes accuracy.\n• Mono-only (stereo disabled)."
-        }
-        self.status.set(ins.get(mode, "Ready"))
+        self.status.set(_INSTRUCTIONS.get(mode, "Ready"))
         if mode in ("context", "overspeed"):
             self.copy_text.config(state="normal")
         else:
+            self.copy_text.config(state="normal")
             self.copy_text.delete("1.0", "end")
-            self.copy_text.insert("1.0", "Type what you copy here (A–Z, 0–9, spaces ignored in scoring).")
             self.copy_text.config(state="disabled")
+            self._copy_hint.place(x=2, y=2)
+
+    def _copy_key_filter(self, event):
+        """Drop typed characters that scoring would strip anyway.
+
+        Only printable keys other than A-Z, 0-9 and space are blocked;
+        editing keys and Ctrl shortcuts pass through. Pasted text is not
+        filtered, so scoring still normalizes the copy.
+        """
+        ch = event.char
+        if len(ch) == 1 and ch.isprintable() and ch != " " and ch.upper() not in MORSE_KEYS:
+            return "break"
+        return None
+
+    def _restore_copy_hint(self, _event=None):
+        """Show the copy hint again when the box is left empty."""
+        if not self.copy_text.get("1.0", "end-1c").strip():
+            self._copy_hint.place(x=2, y=2)
+
+    def _snap_sep(self, _event=None):
+        """Snap the separation slider to quarter steps when it is released.
+
+        Dragging runs no Python code; the value is rounded once per release
+        and only written back when it actually moves.
+        """
+        v = self.sep_pct.get()
+        snapped = min(1.0, max(0.0, round(v * 4) / 4))
+        if abs(snapped - v) > 1e-9:
+            self.sep_pct.set(snapped)
+
+    def _on_pair_changed(self, *_):
+        """Re-parse the active pair entry after each edit."""
+        self._pair_parsed = _parse_pair(self.active_pair.get())
 
     def _choose_log_dir(self):
         d = filedialog.askdirectory(initialdir=self.log_dir.get(), title="Choose log directory")
@@ -187,58 +318,50 @@ class App(tk.Tk):
             messagebox.showinfo("Busy", "A session is already running. Press Stop first.")
             return
 
-        # Validate pair input
-        pair_str = self.active_pair.get().replace(" ", "")
-        if "," not in pair_str:
-            messagebox.showerror("Pair error", "Enter active pair as A,B (e.g., H,5)")
-            return
-
-        parts = pair_str.split(",")
-        if len(parts) != 2:
-            messagebox.showerror("Pair error", "Enter exactly two characters separated by comma (e.g., H,5)")
-            return
-
-        a, b = parts[0].strip().upper(), parts[1].strip().upper()
-        if not a or not b:
-            messagebox.showerror("Pair error", "Both characters must be non-empty")
-            return
-
-        if a not in MORSE_MAP:
-            messagebox.showerror("Pair error", f"Character '{a}' is not valid. Use A-Z or 0-9.")
+        # Pair is parsed when the entry changes; see _on_pair_changed
+        pair, err = self._pair_parsed
+        if err:
+            messagebox.showerror("Pair error", err)
             return
-        if b not in MORSE_MAP:
-            messagebox.showerror("Pair error", f"Character '{b}' is not valid. Use A-Z or 0-9.")
+        a, b = pair
+
+        # Keystroke validation keeps letters out of the numeric fields, but a
+        # field can still be left empty or hold just "."
+        mode = self.mode.get()
+        try:
+            # Validate audio parameters
+            wpm = self.wpm.get()
+            if wpm <= 0 or wpm > 100:
+                messagebox.showerror("WPM error", "WPM must be between 1 and 100")
+                return
+
+            tone_hz = self.tone.get()
+            if tone_hz < 100 or tone_hz > 2000:
+                messagebox.showerror("Tone error", "Tone frequency must be between 100 and 2000 Hz")
+                return
+
+            spec = DrillSpec(
+                mode=mode,
+                pair=(a, b),
+                wpm=wpm,
+                tone_hz=tone_hz,
+                jitter_pct=self.jitter.get(),
+                wpm_jitter=self.wpm_jitter.get(),
+                tone_jitter_hz=self.tone_jitter.get(),
+                stereo=(mode in ("reanchor","contrast")) and self.stereo.get(),
+                pan_strength=self.sep_pct.get(),
+                low_wpm=self.low_wpm.get(),
+                high_wpm=self.high_wpm.get(),
+                block_seconds=self.block_seconds.get(),
+                overspeed_wpm=self.overspeed_wpm.get()
+            )
+        except tk.TclError:
+            messagebox.showerror("Input error", "Every numeric field needs a number")
             return
 
-        # Validate audio parameters
-        wpm = self.wpm.get()
-        if wpm <= 0 or wpm > 100:
-            messagebox.showerror("WPM error", "WPM must be between 1 and 100")
-            return
-
-        tone_hz = self.tone.get()
-        if tone_hz < 100 or tone_hz > 2000:
-            messagebox.showerror("Tone error", "Tone frequency must be between 100 and 2000 Hz")
-            return
-
-        spec = DrillSpec(
-            mode=self.mode.get(),
-            pair=(a, b),
-            wpm=wpm,
-            tone_hz=tone_hz,
-            jitter_pct=self.jitter.get(),
-            wpm_jitter=self.wpm_jitter.get(),
-            tone_jitter_hz=self.tone_jitter.get(),
-            stereo=(self.mode.get() in ("reanchor","contrast")) and self.stereo.get(),
-            pan_strength=self.sep_pct.get(),
-            low_wpm=self.low_wpm.get(),
-            high_wpm=self.high_wpm.get(),
-            block_seconds=self.block_seconds.get(),
-            overspeed_wpm=self.overspeed_wpm.get()
-        )
-
-        os.makedirs(self.log_dir.get(), exist_ok=True)
-        log_path = os.path.join(self.log_dir.get(), f"session_{int(time.time())}.csv")
+        log_dir = self.log_dir.get()
+        os.makedirs(log_dir, exist_ok=True)
+        log_path = os.path.join(log_dir, f"session_{time.time_ns()}.csv")
 
         self.runner = SessionRunner(spec, log_path, self.update_status)
         self.runner.start()
@@ -249,44 +372,122 @@ class App(tk.Tk):
             self.update_status(f"Running {spec.mode} for pair {a}/{b} (mono) ... logging to {log_path}")
 
     def stop_session(self):
-        """Stop the runner and, when appropriate, compute and show metrics."""
-        if self.runner:
-            with self.runner._sent_lines_lock:
-                sent_lines = list(self.runner.sent_lines)
-            pair_str = self.runner.spec.pair  # Get the actual (a,b) tuple
-            self.runner.stop()
+        """Stop the runner and, when appropriate, compute and show metrics.
+
+        Scoring and the metrics append run on a worker thread so the Tk event
+        loop stays responsive; the result is shown via ``_poll_metrics``.
+        """
+        runner = self.runner
+        if runner:
+            spec = runner.spec
+            expected = runner.norm_expected  # empty when nothing was sent
+            log_path = runner.log_path  # File created by this session
+            runner.stop()
             self.runner = None
-            mode = self.mode.get()
-            if mode in ("context","overspeed") and sent_lines:
-                expected = norm_text(' '.join(sent_lines))
+            mode = spec.mode  # the running mode, even if the menu changed since
+            pair_str = spec.pair  # Get the actual (a,b) tuple
+            if mode in ("context","overspeed") and expected:
                 try:
-                    typed = self.copy_text.get("1.0","end")
+                    typed = self.copy_text.get("1.0", "end-1c")
                 except Exception:
                     typed = ""
-                typed_norm = norm_text(typed)
-                total = len(expected)
-                dist = levenshtein(expected, typed_norm) if total>0 else 0
-                acc = (1.0 - dist/max(1,total)) * 100.0
-                pair_normalized = f"{pair_str[0]}{pair_str[1]}"  # "H5" not "H,5"
-                try:
-                    files = sorted([f for f in os.listdir(self.log_dir.get()) if f.startswith("session_") and f.endswith(".csv")])
-                    if files:
-                        last = os.path.join(self.log_dir.get(), files[-1])
-                        with open(last, "a", newline="") as f:
-                            w = csv.writer(f)
-                            w.writerow(["metrics", mode, pair_normalized, "chars_total", total])
-                            w.writerow(["metrics", mode, pair_normalized, "levenshtein", dist])
-                            w.writerow(["metrics", mode, pair_normalized, "accuracy_pct", f"{acc:.2f}"])
-                except Exception:
-                    pass
-                messagebox.showinfo("VBZBreaker — Session Metrics",
-                                    f"Mode: {mode}\n"
-                                    f"Pair: {self.active_pair.get()}\n"
-                                    f"Total chars (gt): {total}\n"
-                                    f"Levenshtein distance: {dist}\n"
-                                    f"Accuracy: {acc:.2f}%")
+                results: 'queue.SimpleQueue' = queue.SimpleQueue()
+                threading.Thread(
+                    target=self._score_worker,
+                    args=(runner, results, expected, typed, mode, pair_str, log_path),
+                    daemon=True,
+                ).start()
+                self.after(METRICS_POLL_MS, self._poll_metrics, results, mode, pair_str)
         self.update_status("Stopped.")
 
+    def _score_worker(self, runner: SessionRunner, results: 'queue.SimpleQueue', *score_args):
+        """Worker thread body: wait for the session to finish, then score it.
+
+        The runner joins its LogThread before exiting, so once it is joined
+        the header and every buffered row are on disk and the metrics rows
+        land after them. Any failure is posted instead of a result, so
+        ``_poll_metrics`` always gets an answer.
+        """
+        try:
+            runner.join()
+            results.put(self._score_and_log(*score_args))
+        except Exception as e:
+            results.put(e)
+
+    def _score_and_log(self, expected: str, typed: str, mode: str,
+                       pair: Tuple[str, str], log_path: str) -> Tuple[int, int, float]:
+        """Score ``typed`` against ``expected`` and append metrics to ``log_path``.
+
+        Runs on a worker thread, so it must not touch Tk widgets or variables.
+
+        Returns:
+            (total chars, Levenshtein distance, accuracy percent)
+        """
+        typed_norm = norm_text(typed)
+        total = len(expected)
+        # Nothing typed / exact copy have known distances; skip the DP
+        if not typed_norm:
+            dist = total
+        elif typed_norm == expected:
+            dist = 0
+        else:
+            dist = levenshtein(expected, typed_norm)
+        acc = (1.0 - dist/max(1,total)) * 100.0
+        pair_normalized = f"{pair[0]}{pair[1]}"  # "H5" not "H,5"
+        try:
+            if os.path.exists(log_path):
+                # Fixed schema with no commas/quotes, so no csv quoting needed
+                payload = (
+                    f"metrics,{mode},{pair_normalized},chars_total,{total}\r\n"
+                    f"metrics,{mode},{pair_normalized},levenshtein,{dist}\r\n"
+                    f"metrics,{mode},{pair_normalized},accuracy_pct,{acc:.2f}\r\n"
+                )
+                with open(log_path, "a", newline="", buffering=METRICS_BUFFER_SIZE) as f:
+                    f.write(payload)
+                    # Off the Tk thread, so durability costs the UI nothing
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception:
+            pass
+        return total, dist, acc
+
+    def _poll_metrics(self, results: 'queue.SimpleQueue', mode: str, pair: Tuple[str, str]):
+        """Show scoring results once the worker has posted them (Tk thread)."""
+        try:
+            result = results.get_nowait()
+        except queue.Empty:
+            self.after(METRICS_POLL_MS, self._poll_metrics, results, mode, pair)
+            return
+        if isinstance(result, Exception):
+            messagebox.showerror("Scoring error", f"Could not score the session: {result}")
+            return
+        total, dist, acc = result
+        self._show_metrics(f"Mode: {mode}\n"
+                           f"Pair: {pair[0]},{pair[1]}\n"
+                           f"Total chars (gt): {total}\n"
+                           f"Levenshtein distance: {dist}\n"
+                           f"Accuracy: {acc:.2f}%")
+
+    def _show_metrics(self, text: str):
+        """Show session metrics in a non-modal window, reused across sessions.
+
+        Unlike messagebox.showinfo this does not run a nested event loop, so
+        the user can start the next session without dismissing it first.
+        """
+        if self._metrics_win is None:
+            win = tk.Toplevel(self)
+            win.title("VBZBreaker — Session Metrics")
+            win.resizable(False, False)
+            win.transient(self)
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            self._metrics_lbl = ttk.Label(win, justify="left")
+            self._metrics_lbl.pack(padx=12, pady=(12, 6))
+            ttk.Button(win, text="OK", command=win.withdraw).pack(pady=(0, 12))
+            self._metrics_win = win
+        self._metrics_lbl.config(text=text)
+        self._metrics_win.deiconify()
+        self._metrics_win.lift()
+
     def _on_closing(self):
         """Clean up and close the application gracefully."""
         if self.runner:
@@ -5,54 +5,110 @@ lines used by the various drill modes, and the DrillSpec dataclass which
 encapsulates per-session parameters.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple
 import random
 
+try:
+    import numpy as np
+except (ImportError, ModuleNotFoundError):
+    np = None
 
-def build_pair_sequences(pair: Tuple[str, str], lines: int = 6) -> List[str]:
-    """Construct a list of A/B pattern lines for contrast/overspeed drills.
+
+# Token pools for synthetic call-like context lines
+_CALL_PREFIXES = ("W", "K", "N", "AA", "AB", "NU", "DL", "F", "I")
+_DIGITS = "0123456789"
+_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+if np is not None:
+    # Byte views of the pools so a whole batch of picks joins in one call
+    _DIGIT_BYTES = np.frombuffer(_DIGITS.encode("ascii"), dtype="S1")
+    _LETTER_BYTES = np.frombuffer(_LETTERS.encode("ascii"), dtype="S1")
+    _PREFIX_LENS = np.array([len(p) for p in _CALL_PREFIXES])
+
+
+@lru_cache(maxsize=64)
+def build_pair_sequences(pair: Tuple[str, str], lines: int = 6) -> Tuple[str, ...]:
+    """Construct the A/B pattern lines for contrast/overspeed drills.
+
+    Results are cached per (pair, lines), so restarting a drill on the same
+    pair reuses the lines.
 
     Args:
-        pair: Tuple of two characters (A, B).
+        pair: Tuple of two upper-case characters (A, B), as in DrillSpec.pair.
         lines: Number of returned lines (max 6 in the template).
 
     Returns:
-        A list of strings, each containing A/B patterns and spacing.
+        A tuple of strings, each containing A/B patterns and spacing.
     """
-    a, b = pair[0].upper(), pair[1].upper()
-    base = [
+    a, b = pair
+    base = (
         f"{a}{b}{a}{b}{a}  {b}{a}{a}{b}  {a}{b}{b}{b}{a}",
         f"{b}{a}{b}{a}{b}  {a}{b}{b}{a}  {b}{b}{a}{a}{b}",
         f"{a*4}  {b*4}  {a}{b}{a}{b}{a}{b}",
         f"{a}{a}{b}{b}  {b}{a}{a}{b}  {a}{b}{b}{a}{a}",
         f"{b}{b}{a}{a}  {a}{b}{a}{a}{b}  {b}{a}{b}{b}{a}",
         f"{a}{b}{a}{a}{b}  {b}{a}{b}{a}{a}  {a}{a}{b}{b}{a}",
-    ]
+    )
     return base[:lines]
 
 
-def build_context_lines(pair: Tuple[str, str], lines: int = 6) -> List[str]:
-    """Generate synthetic call-like context lines that include the A/B pair.
+def _context_tokens(a: str, b: str, count: int) -> List[str]:
+    """Draw ``count`` random call-like tokens with A and B inserted.
 
-    The lines are noisy, with random tokens and numeric inserts, to simulate
-    realistic 'call' patterns for the context drill mode.
+    Each token is a call prefix, 1-3 digits and 2-3 letters, with A and then
+    B inserted at random positions. Pure-Python fallback when NumPy is absent.
     """
-    a, b = pair[0].upper(), pair[1].upper()
     tokens = []
-    for _ in range(lines*3):
-        left = random.choice(["W", "K", "N", "AA", "AB", "NU", "DL", "F", "I"])
-        mid = ''.join(random.choices("0123456789", k=random.choice([1,2,3])))
-        right = ''.join(random.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=random.choice([2,3])))
+    for _ in range(count):
+        left = random.choice(_CALL_PREFIXES)
+        mid = ''.join(random.choices(_DIGITS, k=random.choice((1, 2, 3))))
+        right = ''.join(random.choices(_LETTERS, k=random.choice((2, 3))))
         s = f"{left}{mid}{right}"
         insert_at = random.randint(0, len(s))
         s = s[:insert_at] + a + s[insert_at:]
         insert_at = random.randint(0, len(s))
         s = s[:insert_at] + b + s[insert_at:]
         tokens.append(s)
-    lines_out = []
-    for i in range(0, len(tokens), 3):
-        lines_out.append('  '.join(tokens[i:i+3]))
-    return lines_out[:lines]
+    return tokens
+
+
+def _context_tokens_np(a: str, b: str, count: int) -> List[str]:
+    """Vectorized _context_tokens(): all random draws come from a few NumPy calls."""
+    rng = np.random.default_rng()
+    left_idx = rng.integers(0, len(_CALL_PREFIXES), size=count)
+    mid_len = rng.integers(1, 4, size=count)
+    right_len = rng.integers(2, 4, size=count)
+    mid_all = _DIGIT_BYTES[rng.integers(0, 10, size=int(mid_len.sum()))].tobytes().decode("ascii")
+    right_all = _LETTER_BYTES[rng.integers(0, 26, size=int(right_len.sum()))].tobytes().decode("ascii")
+    base_len = _PREFIX_LENS[left_idx] + mid_len + right_len
+    # B is inserted after A, into a string one character longer
+    ins_a = rng.integers(0, base_len + 1)
+    ins_b = rng.integers(0, base_len + 2)
+
+    tokens = []
+    m = r = 0
+    for li, ml, rl, ia, ib in zip(left_idx.tolist(), mid_len.tolist(), right_len.tolist(),
+                                  ins_a.tolist(), ins_b.tolist()):
+        s = f"{_CALL_PREFIXES[li]}{mid_all[m:m+ml]}{right_all[r:r+rl]}"
+        m += ml
+        r += rl
+        s = s[:ia] + a + s[ia:]
+        s = s[:ib] + b + s[ib:]
+        tokens.append(s)
+    return tokens
+
+
+def build_context_lines(pair: Tuple[str, str], lines: int = 6) -> Tuple[str, ...]:
+    """Generate synthetic call-like context lines that include the A/B pair.
+
+    The lines are noisy, with random tokens and numeric inserts, to simulate
+    realistic 'call' patterns for the context drill mode. ``pair`` holds
+    two upper-case characters, as in DrillSpec.pair.
+    """
+    a, b = pair
+    make_tokens = _context_tokens if np is None else _context_tokens_np
+    tokens = make_tokens(a, b, lines*3)
+    return tuple('  '.join(tokens[i:i+3]) for i in range(0, len(tokens), 3))[:lines]
 
 
 @dataclass
@@ -75,3 +131,7 @@ class DrillSpec:
     high_wpm: float = 36.0
     block_seconds: float = 12.0
     overspeed_wpm: float = 30.0
+
+    def __post_init__(self):
+        # Normalize once here so runners and sequence builders need not
+        self.pair = (self.pair[0].upper(), self.pair[1].upper())
@@ -1,14 +1,17 @@
 """Session and audio thread management for VBZBreaker.
 
-This module runs the SessionRunner which orchestrates the drill flow and
-an AudioThread consumer that writes numpy stereo frames to sounddevice.
+This module runs the SessionRunner which orchestrates the drill flow, an
+AudioThread that plays int16 stereo frames from an AudioRing through a
+sounddevice callback stream and a LogThread that appends event rows to the
+session CSV.
 """
 import threading
 import os
-import csv
 import queue
 import time
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from typing import Iterable, Iterator, Optional, List, Tuple
 
 try:
     import numpy as np
@@ -18,53 +21,180 @@ except (ImportError, ModuleNotFoundError):
     sd = None
 
 from vbz_synth import MorseSynth, SynthConfig
-from vbz_drill import DrillSpec
-from vbz_utils import DEFAULT_SAMPLE_RATE
+from vbz_drill import DrillSpec, build_pair_sequences, build_context_lines
+from vbz_utils import DEFAULT_SAMPLE_RATE, norm_text
 
 # Audio processing constants
 AUDIO_CHUNK_SIZE = 4096
-AUDIO_QUEUE_MAX_SIZE = 8
-QUEUE_PUT_TIMEOUT = 0.5
+AUDIO_RING_FRAMES = 8 * AUDIO_CHUNK_SIZE  # playback buffer: AUDIO_RING_FRAMES / DEFAULT_SAMPLE_RATE s
+
+# Event logging: rows are written in batches by a LogThread
+LOG_QUEUE_MAX_SIZE = 1024
+LOG_FLUSH_BYTES = 64 * 1024  # write once this much is buffered...
+LOG_FLUSH_SECONDS = 1.0  # ...or once buffered rows are this old
+LOG_LINE_END = "\r\n"  # same terminator csv.writer used
 
 # Drill timing constants (in seconds)
 DRILL_DURATION_SECONDS = 120  # 2 minutes
 RAMP_DURATION_SECONDS = 0.005
 
 
+class AudioRing:
+    """Fixed-size int16 stereo ring buffer between the producer and the stream callback.
+
+    One thread writes and one reads. Samples are copied outside the lock;
+    the lock only guards the read/write counters, which count frames ever
+    written/read (positions in the buffer are taken modulo its size).
+    """
+    def __init__(self, frames: int):
+        self._buf = np.zeros((frames, 2), dtype=np.int16)
+        self._size = frames
+        self._r = 0
+        self._w = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def write(self, audio) -> bool:
+        """Copy all of ``audio`` into the ring, waiting while it is full.
+
+        Returns False if the ring was closed before everything fit.
+        """
+        size, buf, cond = self._size, self._buf, self._cond
+        pos, n = 0, len(audio)
+        while pos < n:
+            with cond:
+                while self._w - self._r >= size and not self._closed:
+                    cond.wait()  # woken by each read_into() and by close()
+                if self._closed:
+                    return False
+                w = self._w
+                free = size - (w - self._r)
+            start = w % size
+            k = min(free, n - pos, size - start)
+            buf[start:start + k] = audio[pos:pos + k]
+            pos += k
+            with cond:
+                self._w += k
+                cond.notify_all()
+        return True
+
+    def read_into(self, out) -> int:
+        """Fill ``out`` from the ring, padding with silence; return frames read."""
+        size, buf = self._size, self._buf
+        with self._cond:
+            r = self._r
+            n = min(len(out), self._w - r)
+        start = r % size
+        k = min(n, size - start)
+        out[:k] = buf[start:start + k]
+        out[k:n] = buf[:n - k]
+        out[n:] = 0
+        with self._cond:
+            self._r += n
+            self._cond.notify_all()
+        return n
+
+    def close(self):
+        """Mark the end of the audio and wake any waiting thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def wait_drained(self, stop_flag: threading.Event):
+        """Block until the ring is closed and fully read, or stop_flag is set."""
+        with self._cond:
+            while not stop_flag.is_set() and not (self._closed and self._r >= self._w):
+                self._cond.wait()
+
+
 class AudioThread(threading.Thread):
-    """Background thread that pulls frames from a queue and writes them.
+    """Background thread that owns the output stream for a session.
 
-    The thread exits gracefully on receipt of None or when stop_flag is set.
+    The stream runs in callback mode: PortAudio pulls frames straight from
+    the AudioRing. The thread exits once the ring is closed and drained, or
+    when stop_flag is set.
     """
-    def __init__(self, q_frames: queue.Queue, stop_flag: threading.Event):
+    def __init__(self, ring: AudioRing, stop_flag: threading.Event):
         super().__init__(daemon=True)
-        self.q_frames = q_frames
+        self.ring = ring
         self.stop_flag = stop_flag
 
     def run(self):
-        """Continuously read frames and write to sound device output stream."""
+        """Open the sound device output stream and keep it alive while audio remains."""
         if sd is None or np is None:
             return
+        read_into = self.ring.read_into
+
+        def callback(outdata, frames, time_info, status):
+            read_into(outdata)
+
         try:
-            with sd.OutputStream(channels=2, dtype='float32', samplerate=DEFAULT_SAMPLE_RATE) as stream:
-                while not self.stop_flag.is_set():
-                    try:
-                        frame = self.q_frames.get(timeout=0.1)
-                    except queue.Empty:
-                        continue
-                    if frame is None:
-                        break
-                    stream.write(frame)
+            with sd.OutputStream(channels=2, dtype='int16', samplerate=DEFAULT_SAMPLE_RATE,
+                                 callback=callback):
+                self.ring.wait_drained(self.stop_flag)
         except Exception as e:
             print("Audio error:", e)
 
 
+class LogThread(threading.Thread):
+    """Background thread that appends preformatted rows to the session log.
+
+    Rows are pulled from a queue and collected in a byte buffer that is
+    written with a single os.write once it reaches LOG_FLUSH_BYTES or has
+    waited LOG_FLUSH_SECONDS, so disk latency never stalls the audio
+    producer. The thread exits on receipt of None, after writing everything
+    queued before it.
+    """
+    def __init__(self, log_path: str, q_rows: queue.Queue):
+        super().__init__(daemon=True)
+        self.log_path = log_path
+        self.q_rows = q_rows
+
+    @staticmethod
+    def _write_all(fd: int, buf: bytearray):
+        """Write and clear the buffer, looping over any short writes."""
+        done = 0
+        while done < len(buf):
+            done += os.write(fd, buf[done:])
+        buf.clear()
+
+    def run(self):
+        """Write the CSV header, then rows until the sentinel."""
+        try:
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        except OSError as e:
+            print("Log error:", e)
+            return
+        buf = bytearray(f"timestamp,mode,pair,event,info{LOG_LINE_END}".encode("utf-8"))
+        get, monotonic = self.q_rows.get, time.monotonic
+        flush_at = monotonic() + LOG_FLUSH_SECONDS
+        try:
+            while True:
+                try:
+                    row = get(timeout=LOG_FLUSH_SECONDS)
+                except queue.Empty:
+                    pass
+                else:
+                    if row is None:
+                        break
+                    buf += row.encode("utf-8")
+                now = monotonic()
+                if len(buf) >= LOG_FLUSH_BYTES or (buf and now >= flush_at):
+                    self._write_all(fd, buf)
+                    flush_at = now + LOG_FLUSH_SECONDS
+            self._write_all(fd, buf)
+        except Exception as e:
+            print("Log error:", e)
+        finally:
+            os.close(fd)
+
+
 class SessionRunner(threading.Thread):
     """Drive a drill session: generate audio and log events.
 
     Responsibilities:
-      - Create a synth for each block
-      - Push audio chunks into a bounded queue for playback
+      - Create the synths each drill needs
+      - Copy audio into a ring buffer read by the playback stream
       - Log events to CSV
     """
     def __init__(self, spec: DrillSpec, log_path: str, update_ui_cb):
@@ -73,17 +203,38 @@ class SessionRunner(threading.Thread):
         self.log_path = log_path
         self.update_ui_cb = update_ui_cb
         self.stop_flag = threading.Event()
-        self.q_frames: 'queue.Queue' = queue.Queue(maxsize=AUDIO_QUEUE_MAX_SIZE)
+        self._ring: Optional[AudioRing] = None  # created in run(), once NumPy is known to be present
         self.sent_lines: List[str] = []  # ground-truth lines for Context/Overspeed
+        self._norm_sent: List[str] = []  # norm_text() of each sent line, kept in step
         self._sent_lines_lock = threading.Lock()  # Protect sent_lines from concurrent access
+        self.q_log: 'queue.Queue' = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+        self._log_tag = ""  # "mode,pair" prefix shared by every row, set in run()
+
+    @property
+    def norm_expected(self) -> str:
+        """Normalized ground truth for scoring: norm_text() of all sent lines.
+
+        Lines are normalized as they are sent, so reading this is cheap.
+        """
+        with self._sent_lines_lock:
+            return ''.join(self._norm_sent)
+
+    def _record_sent(self, line: str, norm: str):
+        """Append a line to the ground truth along with its norm_text() form.
+
+        Drills replay a fixed set of lines, so callers normalize each line
+        once up front and pass it in; the lock is held only for the appends.
+        """
+        with self._sent_lines_lock:
+            self.sent_lines.append(line)
+            self._norm_sent.append(norm)
 
     def stop(self):
-        """Signal the runner to stop and attempt to unblock the audio thread."""
+        """Signal the runner to stop and unblock both the producer and the audio thread."""
         self.stop_flag.set()
-        try:
-            self.q_frames.put(None, timeout=0.1)
-        except queue.Full:
-            pass  # Queue is full, thread will exit via stop_flag
+        ring = self._ring
+        if ring is not None:
+            ring.close()
 
     def _make_synth(self, wpm=None, tone=None, stereo=None) -> MorseSynth:
         """Build a MorseSynth configured for a block of audio.
@@ -108,129 +259,156 @@ class SessionRunner(threading.Thread):
         )
         return MorseSynth(cfg)
 
+    def _log(self, event: str, info: str):
+        """Hand a log row to the LogThread.
+
+        Rows have a fixed schema, so they are formatted directly rather than
+        through csv.writer; ``info`` is sanitized of commas and newlines. If
+        the writer falls far behind, rows are dropped rather than blocking
+        audio production.
+        """
+        info = info.replace(",", " ").replace("\n", " ").replace("\r", " ")
+        try:
+            self.q_log.put_nowait(f"{time.time()},{self._log_tag},{event},{info}{LOG_LINE_END}")
+        except queue.Full:
+            pass
+
     def _enqueue_audio(self, audio):
-        """Break audio into chunks and enqueue them for playback.
+        """Copy audio into the playback ring.
 
-        This method handles queue.Full by retrying with a short timeout so
-        the function remains responsive to stop requests.
+        Blocks while the ring is full; returns early once the session is
+        stopped, since stop() closes the ring.
         """
-        for i in range(0, len(audio), AUDIO_CHUNK_SIZE):
-            if self.stop_flag.is_set():
-                return
-            placed = False
-            while not placed:
-                if self.stop_flag.is_set():
-                    return
-                try:
-                    # small timeout to remain interruptible
-                    self.q_frames.put(audio[i:i+AUDIO_CHUNK_SIZE], timeout=QUEUE_PUT_TIMEOUT)
-                    placed = True
-                except queue.Full:
-                    continue
+        self._ring.write(audio)
 
     def run(self):
-        """Main thread run: open log file, start audio thread and run the selected mode."""
+        """Main thread run: start the log and audio threads and run the selected mode."""
         if np is None:
             self.update_ui_cb("NumPy is not available. Install numpy to run audio.")
             return
         os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
-        with open(self.log_path, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "mode", "pair", "event", "info"])
+        self._log_tag = f"{self.spec.mode},{self.spec.pair[0]}{self.spec.pair[1]}"
+        log_thr = LogThread(self.log_path, self.q_log)
+        log_thr.start()
 
-            audio_thr = AudioThread(self.q_frames, self.stop_flag)
-            audio_thr.start()
+        self._ring = AudioRing(AUDIO_RING_FRAMES)
+        audio_thr = AudioThread(self._ring, self.stop_flag)
+        audio_thr.start()
 
-            mode = self.spec.mode
+        mode = self.spec.mode
+        try:
             if mode == 'reanchor':
-                self._run_reanchor(writer)
+                self._run_reanchor()
             elif mode == 'contrast':
-                self._run_contrast(writer)
+                self._run_contrast()
             elif mode == 'context':
-                self._run_context(writer)
+                self._run_context()
             elif mode == 'overspeed':
-                self._run_overspeed(writer)
+                self._run_overspeed()
             else:
                 self.update_ui_cb("Unknown mode")
+        finally:
+            # Sentinel is never dropped; join so no queued rows are lost
+            if log_thr.is_alive():
+                self.q_log.put(None)
+                log_thr.join()
 
-            try:
-                self.q_frames.put(None, timeout=0.5)
-            except queue.Full:
-                pass  # Audio thread will exit naturally
+        self._ring.close()
+
+    @staticmethod
+    def _render_ahead(syn: MorseSynth, lines: Iterable[str],
+                      gap: str = "   ") -> Iterator[Tuple[str, 'np.ndarray']]:
+        """Yield (line, audio) pairs, rendering the next line in a worker.
+
+        While the caller logs and enqueues one line, the following line is
+        already being synthesized. ``audio`` holds the line followed by the
+        ``gap`` word spaces, rendered as one string; that is the same audio
+        as rendering the two separately.
+
+        The worker is the only thread that uses ``syn``: MorseSynth's caches
+        and the ``random`` stream behind jitter are not locked, so the caller
+        must not touch ``syn`` until the generator is exhausted or closed.
+        Without jitter every line is a cache hit after the first pass, so the
+        overlap mainly pays off for jittered sessions.
+        """
+        it = iter(lines)
+        line = next(it, None)
+        if line is None:
+            return
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(syn.string_audio, line + gap)
+            for nxt in it:
+                audio = pending.result()
+                pending = pool.submit(syn.string_audio, nxt + gap)
+                yield line, audio
+                line = nxt
+            yield line, pending.result()
 
     # ---- Drill runners are thin wrappers delegated to synth/drill ----
-    def _run_reanchor(self, writer):
+    def _run_reanchor(self):
         """Run the re-anchor drill loop, alternating slow/fast blocks.
 
-        The method logs block events and pushes synthesized audio into the queue.
+        The method logs block events and pushes synthesized audio into the ring.
         """
-        from vbz_drill import build_pair_sequences
-        a, b = self.spec.pair[0].upper(), self.spec.pair[1].upper()
+        a, b = self.spec.pair
         pattern = f"{a}{b}" * 8
-        t_end = time.time() + DRILL_DURATION_SECONDS
+        monotonic, stopped = time.monotonic, self.stop_flag.is_set
+        deadline = monotonic() + DRILL_DURATION_SECONDS
         self.update_ui_cb("Re-anchor mode:\nListen (or send) alternating A/B at slow↔fast speeds. Focus on FEEL of rhythm (no copying).")
-        while not self.stop_flag.is_set() and time.time() < t_end:
-            writer.writerow([time.time(), self.spec.mode, a+b, "block", f"{self.spec.low_wpm}wpm"])
-            syn = self._make_synth(wpm=self.spec.low_wpm)
-            self._enqueue_audio(syn.string_audio(pattern))
-            if self.stop_flag.is_set():
+        # One synth per speed for the whole drill; without jitter each renders
+        # the pattern once and replays it from the synth's cache
+        syn_low = self._make_synth(wpm=self.spec.low_wpm)
+        syn_high = self._make_synth(wpm=self.spec.high_wpm)
+        while not stopped() and monotonic() < deadline:
+            self._log("block", f"{self.spec.low_wpm}wpm")
+            self._enqueue_audio(syn_low.string_audio(pattern))
+            if stopped():
                 break
-            writer.writerow([time.time(), self.spec.mode, a+b, "block", f"{self.spec.high_wpm}wpm"])
-            syn = self._make_synth(wpm=self.spec.high_wpm)
-            self._enqueue_audio(syn.string_audio(pattern))
+            self._log("block", f"{self.spec.high_wpm}wpm")
+            self._enqueue_audio(syn_high.string_audio(pattern))
 
-    def _run_contrast(self, writer):
+    def _run_contrast(self):
         """Run the contrast drill: play short dense A/B lines for copying."""
-        from vbz_drill import build_pair_sequences
-        a, b = self.spec.pair[0].upper(), self.spec.pair[1].upper()
+        a, b = self.spec.pair
         lines = build_pair_sequences((a, b), lines=6)
         syn = self._make_synth()
         self.update_ui_cb("Contrast mode:\nCopy short, dense A/B lines at normal speed. Accuracy matters. Stop if you need to replay.")
         # Repeat lines 4 times without creating copies in memory
-        for _ in range(4):
-            for line in lines:
-                if self.stop_flag.is_set():
-                    break
-                writer.writerow([time.time(), self.spec.mode, a+b, "line", line])
-                self._enqueue_audio(syn.string_audio(line))
-                self._enqueue_audio(syn.string_audio("   "))
+        for line, audio in self._render_ahead(syn, chain.from_iterable(repeat(lines, 4))):
             if self.stop_flag.is_set():
                 break
+            self._log("line", line)
+            self._enqueue_audio(audio)
 
-    def _run_context(self, writer):
+    def _run_context(self):
         """Run the context drill: play call-like context lines and record ground truth."""
-        from vbz_drill import build_context_lines
-        a, b = self.spec.pair[0].upper(), self.spec.pair[1].upper()
+        a, b = self.spec.pair
         lines = build_context_lines((a, b), lines=6)
+        norms = {line: norm_text(line) for line in lines}
         syn = self._make_synth(stereo=False)
         self.update_ui_cb("Context mode:\nCopy what you hear into the input box below (no punctuation). Compare will run on Stop.")
         # Repeat lines 4 times without creating copies in memory
-        for _ in range(4):
-            for line in lines:
-                if self.stop_flag.is_set():
-                    break
-                with self._sent_lines_lock:
-                    self.sent_lines.append(line)
-                writer.writerow([time.time(), self.spec.mode, a+b, "ctx", line])
-                self._enqueue_audio(syn.string_audio(line))
-                self._enqueue_audio(syn.string_audio("   "))
+        for line, audio in self._render_ahead(syn, chain.from_iterable(repeat(lines, 4))):
             if self.stop_flag.is_set():
                 break
+            self._record_sent(line, norms[line])
+            self._log("ctx", line)
+            self._enqueue_audio(audio)
 
-    def _run_overspeed(self, writer):
+    def _run_overspeed(self):
         """Run the overspeed drill: continuous short, high-WPM bursts."""
-        from vbz_drill import build_pair_sequences
-        a, b = self.spec.pair[0].upper(), self.spec.pair[1].upper()
+        a, b = self.spec.pair
         syn = self._make_synth(wpm=self.spec.overspeed_wpm, stereo=False)
         pattern_lines = build_pair_sequences((a, b), lines=6)
-        t_end = time.time() + DRILL_DURATION_SECONDS
+        norms = {line: norm_text(line) for line in pattern_lines}
+        monotonic, stopped = time.monotonic, self.stop_flag.is_set
+        deadline = monotonic() + DRILL_DURATION_SECONDS
         self.update_ui_cb("Overspeed mode:\nShort high-WPM burst. Copy into the input box below; scoring runs on Stop.")
         i = 0
-        while not self.stop_flag.is_set() and time.time() < t_end:
+        while not stopped() and monotonic() < deadline:
             line = pattern_lines[i % len(pattern_lines)]
-            with self._sent_lines_lock:
-                self.sent_lines.append(line)
-            writer.writerow([time.time(), self.spec.mode, a+b, "overspeed_line", line])
+            self._record_sent(line, norms[line])
+            self._log("overspeed_line", line)
             self._enqueue_audio(syn.string_audio(line))
             self._enqueue_audio(syn.string_audio("   "))
             i += 1
@@ -1,17 +1,29 @@
 """Morse synthesizer module.
 
 Contains the SynthConfig dataclass and MorseSynth which generates stereo
-numpy audio buffers for symbols and strings of text.
+numpy audio buffers for symbols and strings of text. Audio is rendered in
+float32 and handed out as int16 PCM, the format the output stream plays.
 """
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import random
 import numpy as np
-from vbz_utils import DEFAULT_SAMPLE_RATE, DEFAULT_TONE_HZ, DEFAULT_WPM, MORSE_MAP, dit_seconds, env_ramp
+from vbz_utils import DEFAULT_SAMPLE_RATE, DEFAULT_TONE_HZ, DEFAULT_WPM, MORSE_MAP, env_ramp, timing_table
+from vbz_synth_kernels import render_tone
 
 # Audio envelope constants
 RAMP_DURATION_SECONDS = 0.005
 
+# Full-scale value for 16-bit PCM output
+PCM16_SCALE = 32767.0
+
+
+def to_pcm16(audio: 'np.ndarray') -> 'np.ndarray':
+    """Quantize a float stereo buffer in [-1, 1] to int16 PCM."""
+    pcm = audio * PCM16_SCALE
+    np.clip(pcm, -32768, 32767, out=pcm)
+    return pcm.astype(np.int16)
+
 
 @dataclass
 class SynthConfig:
@@ -35,16 +47,41 @@ class MorseSynth:
     """Generate Morse code audio buffers according to a SynthConfig.
 
     Public methods:
-      - symbol_audio(symbol): return stereo buffer for a single character
-      - string_audio(text): return stereo buffer for a full text string
+      - symbol_audio(symbol): return int16 stereo buffer for a single character
+      - string_audio(text): return int16 stereo buffer for a full text string
     """
     def __init__(self, cfg: SynthConfig):
-        """Store configuration object.
+        """Store the configuration and precompute per-synth state.
+
+        The timing table, envelope ramp and pan table are built here from
+        ``cfg``, along with empty string, symbol and silence caches, so
+        ``cfg`` should not be changed after construction.
 
         Args:
             cfg: SynthConfig instance.
         """
         self.cfg = cfg
+        # Element and gap durations for cfg.wpm, looked up per element
+        self._timing = timing_table(cfg.wpm)
+        # Fade-in envelope shared by every tone (reversed for the fade-out)
+        self._ramp = env_ramp(self._samples(RAMP_DURATION_SECONDS))
+        # Left/right multipliers for the stereo pair; other symbols stay centred
+        self._pan_table: Dict[str, Tuple[float, float]] = {}
+        sp = cfg.stereo_pair
+        if sp:
+            a = sp[0].upper()
+            s = min(1.0, max(0.0, cfg.pan_strength))
+            for ch in sp:
+                ch = ch.upper()
+                self._pan_table[ch] = (1.0, 1.0 - s) if ch == a else (1.0 - s, 1.0)
+        self._string_cache: Dict[str, np.ndarray] = {}  # text -> audio, jitter-free only
+        self._symbol_cache: Dict[str, np.ndarray] = {}  # symbol -> audio, jitter-free only
+        self._silence_cache: Dict[int, np.ndarray] = {}  # n samples -> zeros, jitter-free only
+
+    @property
+    def deterministic(self) -> bool:
+        """True when no random jitter applies, so renders can be reused."""
+        return self.cfg.jitter_pct <= 0.0 and self.cfg.tone_jitter_hz <= 0.0
 
     def _jitter(self, base: float) -> float:
         """Apply jitter percentage to a base duration.
@@ -58,111 +95,156 @@ class MorseSynth:
         delta = base * j
         return max(0.0, base + random.uniform(-delta, delta))
 
-    def _symbol_to_units(self, symbol: str) -> List[Tuple[str, float]]:
-        """Convert a symbol to a sequence of ('tone'|'sil', seconds) tuples.
+    def _symbol_to_units(self, symbol: str) -> List[float]:
+        """Convert a symbol to its element durations in seconds.
+
+        Tones and the silences between them alternate, so even indices are
+        tones and odd indices are silences; no per-element kind is stored.
 
         Args:
-            symbol: Single character (A-Z, 0-9).
+            symbol: Single upper-case character (A-Z, 0-9).
 
         Returns:
-            A list of tuples denoting tone or silence durations.
+            A list of durations, starting and ending with a tone.
         """
-        wpm = self.cfg.wpm
-        d = dit_seconds(wpm)
-        dah = 3 * d
-        intra = d
-        parts: List[Tuple[str, float]] = []
-        code = MORSE_MAP.get(symbol.upper(), '')
+        timing = self._timing
+        intra = timing[' ']
+        durs: List[float] = []
+        code = MORSE_MAP.get(symbol, '')
         for i, ch in enumerate(code):
-            dur = d if ch == '.' else dah
-            dur = self._jitter(dur)
-            parts.append(('tone', dur))
+            durs.append(self._jitter(timing[ch]))
             if i != len(code) - 1:
-                parts.append(('sil', self._jitter(intra)))
-        return parts
+                durs.append(self._jitter(intra))
+        return durs
 
     def _char_gap(self) -> float:
         """Return jittered gap between characters (3 dits)."""
-        return self._jitter(3 * dit_seconds(self.cfg.wpm))
+        return self._jitter(self._timing['/'])
 
     def _word_gap(self) -> float:
         """Return jittered gap between words (7 dits)."""
-        return self._jitter(7 * dit_seconds(self.cfg.wpm))
+        return self._jitter(self._timing['_'])
 
-    def _tone(self, seconds: float, freq: float, pan: Tuple[float, float]) -> 'np.ndarray':
-        """Synthesize a stereo tone for given duration, frequency and pan.
+    def _samples(self, seconds: float) -> int:
+        """Return the sample count of a tone or gap lasting ``seconds`` (at least 1)."""
+        return max(1, int(seconds * self.cfg.sample_rate))
 
-        Args:
-            seconds: duration in seconds
-            freq: frequency in Hz
-            pan: (left, right) multipliers
+    def _silence(self, seconds: float) -> 'np.ndarray':
+        """Return a stereo silence buffer for ``seconds`` seconds.
 
-        Returns:
-            A numpy array shape (n_samples, 2) float32 in [-1,1] scaled by gain.
+        Without jitter the same few gap lengths recur, so a shared read-only
+        buffer is returned for each length.
         """
-        sr = self.cfg.sample_rate
-        n = max(1, int(seconds * sr))
-        t = np.arange(n, dtype=np.float32) / sr
-        sig = np.sin(2 * np.pi * freq * t).astype(np.float32)
-
-        ramp_samps = max(1, int(RAMP_DURATION_SECONDS * sr))
-        ramp = env_ramp(ramp_samps)
-        sig[:ramp_samps] *= ramp
-        sig[-ramp_samps:] *= ramp[::-1]
-
-        left = (sig * pan[0]).reshape(-1, 1)
-        right = (sig * pan[1]).reshape(-1, 1)
-        stereo = np.concatenate([left, right], axis=1)
-        return stereo * self.cfg.gain
-
-    def _silence(self, seconds: float) -> 'np.ndarray':
-        """Return a stereo silence buffer for ``seconds`` seconds."""
-        sr = self.cfg.sample_rate
-        n = max(1, int(seconds * sr))
-        return np.zeros((n, 2), dtype=np.float32)
+        n = self._samples(seconds)
+        if not self.deterministic:
+            return np.zeros((n, 2), dtype=np.float32)
+        buf = self._silence_cache.get(n)
+        if buf is None:
+            buf = np.zeros((n, 2), dtype=np.float32)
+            buf.flags.writeable = False
+            self._silence_cache[n] = buf
+        return buf
 
     def _pan_for_symbol(self, symbol: str) -> Tuple[float, float]:
-        """Return left/right multipliers depending on stereo_pair and pan strength."""
-        sp = self.cfg.stereo_pair
-        if sp and symbol.upper() in sp:
-            a, b = sp[0].upper(), sp[1].upper()
-            s = min(1.0, max(0.0, self.cfg.pan_strength))
-            if symbol.upper() == a:
-                return (1.0, 1.0 - s)
-            else:
-                return (1.0 - s, 1.0)
-        return (1.0, 1.0)
+        """Return left/right multipliers for an upper-case symbol, per stereo_pair and pan strength."""
+        return self._pan_table.get(symbol, (1.0, 1.0))
 
     def symbol_audio(self, symbol: str) -> 'np.ndarray':
         """Build audio for a single symbol.
 
-        Jitter and tone variation are applied per the SynthConfig.
+        Jitter and tone variation are applied per the SynthConfig. When the
+        synth is deterministic the float render is memoized per symbol.
+        """
+        return to_pcm16(self._symbol_audio(symbol.upper()))
+
+    def _symbol_audio(self, symbol: str) -> 'np.ndarray':
+        """Float32 audio for a symbol that is already upper case (read-only if cached)."""
+        if self.deterministic:
+            audio = self._symbol_cache.get(symbol)
+            if audio is None:
+                audio = self._render_symbol(symbol)
+                audio.flags.writeable = False
+                self._symbol_cache[symbol] = audio
+            return audio
+        return self._render_symbol(symbol)
+
+    def _render_symbol(self, symbol: str) -> 'np.ndarray':
+        """Render ``symbol`` to a fresh stereo buffer (see symbol_audio)."""
+        return self._fill(self._symbol_pieces(symbol))
+
+    def _symbol_pieces(self, symbol: str) -> List[Tuple[int, object]]:
+        """Lay out an upper-case symbol as (n_samples, source) pieces for _fill().
+
+        Tones carry their (freq, pan); silences carry None. Jitter and tone
+        variation are drawn here, in the same order as a direct render.
         """
         base_freq = self.cfg.tone_hz
         if self.cfg.tone_jitter_hz > 0:
             base_freq += random.uniform(-self.cfg.tone_jitter_hz, self.cfg.tone_jitter_hz)
-        parts = self._symbol_to_units(symbol)
-        pan = self._pan_for_symbol(symbol)
-        chunks = []
-        for kind, sec in parts:
-            chunks.append(self._tone(sec, base_freq, pan) if kind == 'tone' else self._silence(sec))
-        return np.concatenate(chunks, axis=0) if chunks else self._silence(0.1)
+        tone = (base_freq, self._pan_for_symbol(symbol))
+        pieces = [(self._samples(sec), None if j & 1 else tone)
+                  for j, sec in enumerate(self._symbol_to_units(symbol))]
+        return pieces or [(self._samples(0.1), None)]
+
+    def _fill(self, pieces: List[Tuple[int, object]]) -> 'np.ndarray':
+        """Allocate one zeroed buffer for ``pieces`` and render each into its slice.
+
+        A piece's source is None for silence (left as zeros), a prerendered
+        buffer to copy, or a (freq, pan) tone rendered in place.
+        """
+        out = np.zeros((sum(n for n, _ in pieces), 2), dtype=np.float32)
+        sr, gain, ramp = self.cfg.sample_rate, self.cfg.gain, self._ramp
+        offset = 0
+        for n, src in pieces:
+            if src is None:
+                pass
+            elif isinstance(src, np.ndarray):
+                out[offset:offset + n] = src
+            else:
+                freq, pan = src
+                render_tone(out[offset:offset + n], freq, sr, ramp, gain, pan[0], pan[1])
+            offset += n
+        return out
 
     def string_audio(self, text: str) -> 'np.ndarray':
-        """Convert a text string into a concatenated stereo audio buffer.
+        """Convert a text string into a concatenated int16 stereo audio buffer.
 
-        Non-mapped characters are ignored; spaces produce word gaps.
+        Non-mapped characters are ignored; spaces produce word gaps. When the
+        synth is deterministic the (read-only) result is memoized per text.
         """
-        chunks = []
-        for i, ch in enumerate(text):
+        if self.deterministic:
+            audio = self._string_cache.get(text)
+            if audio is None:
+                audio = to_pcm16(self._render_string(text))
+                audio.flags.writeable = False
+                self._string_cache[text] = audio
+            return audio
+        return to_pcm16(self._render_string(text))
+
+    def _render_string(self, text: str) -> 'np.ndarray':
+        """Render ``text`` to a float32 stereo buffer (see string_audio).
+
+        The whole string is laid out first so it can be rendered into a
+        single preallocated buffer. Jitter-free symbols are copied from the
+        symbol cache; otherwise tones are rendered in place.
+        """
+        text = text.upper()
+        deterministic = self.deterministic
+        pieces: List[Tuple[int, object]] = []
+        # Pair each character with the next; a trailing space ends the text
+        for ch, nxt in zip(text, text[1:] + ' '):
             if ch == ' ':
-                chunks.append(self._silence(self._word_gap()))
+                pieces.append((self._samples(self._word_gap()), None))
                 continue
-            if ch.upper() not in MORSE_MAP:
+            if ch not in MORSE_MAP:
                 continue
-            chunks.append(self.symbol_audio(ch))
-            if i != len(text) - 1 and text[i+1] != ' ':
-                chunks.append(self._silence(self._char_gap()))
-        if not chunks:
+            if deterministic:
+                sym = self._symbol_audio(ch)
+                pieces.append((len(sym), sym))
+            else:
+                pieces.extend(self._symbol_pieces(ch))
+            if nxt != ' ':
+                pieces.append((self._samples(self._char_gap()), None))
+        if not pieces:
             return self._silence(0.1)
-        return np.concatenate(chunks, axis=0)
+        return self._fill(pieces)
@@ -0,0 +1,76 @@
+"""Sample-level kernels for the Morse synthesizer.
+
+render_tone fills a preallocated stereo buffer with an enveloped, panned
+sine tone in a single pass. When Numba is installed the kernel is JIT
+compiled (and cached on disk) and reads the sine from a lookup table with
+a phase accumulator; otherwise an equivalent NumPy version is used.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except (ImportError, ModuleNotFoundError):
+    njit = None
+
+# One sine period plus a guard entry, so interpolation never wraps
+SIN_LUT_SIZE = 4096
+_SIN_LUT = np.sin(2 * np.pi * np.arange(SIN_LUT_SIZE + 1) / SIN_LUT_SIZE).astype(np.float32)
+
+
+def _render_tone_loop(out, freq, sr, ramp, gain, pan_l, pan_r):
+    """Write a sine tone into ``out``, one sample at a time.
+
+    Args:
+        out: float32 array of shape (n_samples, 2) to fill.
+        freq: tone frequency in Hz.
+        sr: sample rate in Hz.
+        ramp: rising envelope applied to the first samples and, reversed,
+            to the last ones.
+        gain: overall amplitude.
+        pan_l: left channel multiplier.
+        pan_r: right channel multiplier.
+    """
+    n = out.shape[0]
+    r = ramp.shape[0]
+    lut = _SIN_LUT
+    dphase = freq / sr  # cycles per sample; negative for a jittered-below-zero tone
+    phase = 0.0
+    for i in range(n):
+        x = phase * SIN_LUT_SIZE
+        j = int(x)
+        s = (lut[j] + (x - j) * (lut[j + 1] - lut[j])) * gain
+        # Wrap into [0, 1) in either direction; the LUT index must stay in range.
+        # A tiny negative phase rounds up to exactly 1.0, so clamp after the wrap.
+        phase += dphase
+        phase -= math.floor(phase)
+        if phase >= 1.0:
+            phase -= 1.0
+        if i < r:
+            s *= ramp[i]
+        if i >= n - r:
+            s *= ramp[n - 1 - i]
+        out[i, 0] = s * pan_l
+        out[i, 1] = s * pan_r
+
+
+def _render_tone_np(out, freq, sr, ramp, gain, pan_l, pan_r):
+    """NumPy version of _render_tone_loop, used when Numba is missing."""
+    n = out.shape[0]
+    r = ramp.shape[0]
+    # Phase and sine share one scratch array; channels are written straight into out
+    sig = np.arange(n, dtype=np.float32)
+    np.multiply(sig, np.float32(2 * np.pi * freq / sr), out=sig)
+    np.sin(sig, out=sig)
+    sig[:r] *= ramp
+    sig[-r:] *= ramp[::-1]
+    np.multiply(sig, np.float32(pan_l * gain), out=out[:, 0])
+    np.multiply(sig, np.float32(pan_r * gain), out=out[:, 1])
+
+
+if njit is not None:
+    render_tone = njit(cache=True, fastmath=True)(_render_tone_loop)
+else:
+    render_tone = _render_tone_np
+
@@ -4,10 +4,21 @@ This module holds shared constants (MORSE_MAP, defaults) and small helpers
 used across the package: timing math, envelope generation, normalization and
 levenshtein distance computation.
 """
-from typing import Dict
-import re
+from functools import lru_cache
+from typing import Dict, FrozenSet
 import numpy as np
 
+try:
+    # C edit distance (bit-parallel); levenshtein() falls back to Python without it
+    from rapidfuzz.distance.Levenshtein import distance as _rf_distance
+except (ImportError, ModuleNotFoundError):
+    _rf_distance = None
+
+try:
+    from numba import njit
+except (ImportError, ModuleNotFoundError):
+    njit = None
+
 # Morse mapping for A-Z and 0-9
 MORSE_MAP: Dict[str, str] = {
     'A': '.-',    'B': '-...',  'C': '-.-.', 'D': '-..',  'E': '.',
@@ -20,6 +31,9 @@ MORSE_MAP: Dict[str, str] = {
     '5': '.....', '6': '-....', '7': '--...', '8': '---..','9': '----.'
 }
 
+# Characters that have a Morse mapping, for fast membership tests
+MORSE_KEYS: FrozenSet[str] = frozenset(MORSE_MAP)
+
 # Default audio/speed constants
 DEFAULT_SAMPLE_RATE = 48000
 DEFAULT_TONE_HZ = 650.0
@@ -38,38 +52,103 @@ def dit_seconds(wpm: float) -> float:
     return 1.2 / max(1, wpm)
 
 
+def timing_table(wpm: float) -> Dict[str, float]:
+    """Precompute Morse element and gap durations for one speed.
+
+    Keys are the code elements ``'.'`` and ``'-'`` plus ``' '`` (gap between
+    elements of a character), ``'/'`` (gap between characters) and ``'_'``
+    (gap between words).
+
+    Args:
+        wpm: Words per minute (must be > 0).
+
+    Returns:
+        Dict mapping each key to its duration in seconds.
+    """
+    d = dit_seconds(wpm)
+    return {'.': d, '-': 3 * d, ' ': d, '/': 3 * d, '_': 7 * d}
+
+
+@lru_cache(maxsize=32)
 def env_ramp(samples: int) -> 'np.ndarray':
     """Generate a cosine-shaped envelope ramp of length ``samples``.
 
     The ramp is useful to apply short fade-in/fade-out on tones to avoid clicks.
+    Ramps are cached per length and shared, so the array is read-only; take
+    a ``.copy()`` to modify it.
 
     Args:
         samples: Number of ramp samples (int).
 
     Returns:
-        A numpy float32 array containing the ramp from ~0 to 1.
+        A read-only numpy float32 array containing the ramp from ~0 to 1.
     """
-    t = np.arange(samples, dtype=np.float32)
-    ramp = 0.5 * (1 - np.cos(np.pi * (t + 1) / (samples + 1)))
-    return ramp.astype(np.float32)
+    # One float32 buffer, transformed in place: 0.5 * (1 - cos(pi * k / (samples + 1)))
+    ramp = np.arange(1, samples + 1, dtype=np.float32)
+    ramp *= np.float32(np.pi / (samples + 1))
+    np.cos(ramp, out=ramp)
+    np.subtract(np.float32(1.0), ramp, out=ramp)
+    ramp *= np.float32(0.5)
+    ramp.flags.writeable = False
+    return ramp
+
+
+# ASCII bytes that norm_text drops (everything except A-Z and 0-9)
+_NON_ALNUM_ASCII = bytes(c for c in range(128) if not (48 <= c <= 57 or 65 <= c <= 90))
 
 
 def norm_text(s: str) -> str:
     """Normalize text for scoring: uppercase and strip everything except A-Z0-9.
 
+    Non-ASCII characters are dropped by the ASCII encode and the remaining
+    punctuation/whitespace by a single C-level ``bytes.translate``.
+
     Args:
         s: Input string.
 
     Returns:
         Normalized string suitable for comparison/scoring.
     """
-    return re.sub(r'[^A-Z0-9]', '', s.upper())
+    return s.upper().encode('ascii', 'ignore').translate(None, _NON_ALNUM_ASCII).decode('ascii')
+
+
+def _lev_dp(a: 'np.ndarray', b: 'np.ndarray') -> int:
+    """Levenshtein DP over code-point arrays, keeping a single int32 row.
+
+    Written as plain loops so Numba can compile it; ``b`` should be the
+    shorter input.
+    """
+    n = b.shape[0]
+    row = np.arange(n + 1, dtype=np.int32)
+    for i in range(a.shape[0]):
+        ca = a[i]
+        diag = row[0]  # row[i-1][j-1]
+        row[0] = i + 1
+        for j in range(n):
+            up = row[j + 1]
+            best = diag if ca == b[j] else diag + 1  # substitution
+            if row[j] + 1 < best:                    # insertion
+                best = row[j] + 1
+            if up + 1 < best:                        # deletion
+                best = up + 1
+            row[j + 1] = best
+            diag = up
+    return row[n]
+
+
+_lev_core = njit(cache=True)(_lev_dp) if njit is not None else None
+
+
+def _code_points(s: str) -> 'np.ndarray':
+    """Return the code points of ``s`` as a uint32 array."""
+    return np.frombuffer(s.encode('utf-32-le'), dtype=np.uint32)
 
 
 def levenshtein(a: str, b: str) -> int:
     """Compute the Levenshtein (edit) distance between two strings.
 
-    This is a memory-efficient dynamic programming implementation.
+    Uses rapidfuzz when it is installed, else a Numba-compiled DP; without
+    either it falls back to a bit-parallel algorithm in pure Python.
 
     Args:
         a: First string.
@@ -78,16 +157,44 @@ def levenshtein(a: str, b: str) -> int:
     Returns:
         The integer Levenshtein distance.
     """
+    if _rf_distance is not None:
+        return _rf_distance(a, b)
     if len(a) < len(b):
         a, b = b, a
-    prev = list(range(len(b)+1))
-    for i, ca in enumerate(a, 1):
-        cur = [i]
-        for j, cb in enumerate(b, 1):
-            cost = 0 if ca == cb else 1
-            cur.append(min(prev[j] + 1,      # deletion
-                           cur[j-1] + 1,     # insertion
-                           prev[j-1] + cost  # substitution
-                           ))
-        prev = cur
-    return prev[-1]
+    if _lev_core is not None:
+        return int(_lev_core(_code_points(a), _code_points(b)))
+    return _lev_bit_parallel(a, b)
+
+
+def _lev_bit_parallel(a: str, b: str) -> int:
+    """Bit-parallel Levenshtein distance (Myers 1999, as formulated by Hyyrö).
+
+    Each column of the DP for ``b`` is one bit of a Python int, holding the
+    +1/-1 vertical deltas, so a whole column updates in a few integer ops
+    per character of ``a``. Python ints are unbounded, so ``b`` may be
+    longer than 64 characters; it should be the shorter input.
+    """
+    m = len(b)
+    if m == 0:
+        return len(a)
+    peq: Dict[str, int] = {}  # char -> bitmask of its positions in b
+    for i, c in enumerate(b):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    vp, vn, score = mask, 0, m
+    for c in a:
+        eq = peq.get(c, 0)
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn
+        hp = vn | ~(d0 | vp)
+        hn = vp & d0
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        # Row 0 of the DP grows by one per character, so a 1 shifts into HP
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = (hn | ~(d0 | hp)) & mask
+        vn = hp & d0
+    return score